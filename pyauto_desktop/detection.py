@@ -2,20 +2,67 @@ from . import functions as pyauto_desktop
 from . import text_recognition
 from PyQt6.QtCore import QThread, pyqtSignal
 from PyQt6.QtGui import QImage
+import concurrent.futures
+import os
+import threading
 import traceback
 import numpy as np
 import cv2
-from .utils import global_to_local, local_to_global
+from .utils import local_to_global, merge_overlapping_rects, rect_contains
+
+# cv2.matchTemplate releases the GIL, so anchor regions are matched in parallel.
+# The pool outlives the per-step workers so each of its threads keeps its own
+# thread-local MSS instance instead of creating (and leaking GDI handles for) new ones.
+# matchTemplate is itself parallelised by OpenCV's thread pool, so only a few regions
+# run at once; cv2.setNumThreads is process-wide and can't be lowered per thread instead.
+_MATCH_POOL_MAX_WORKERS = 4
+_MATCH_POOL = None
+_MATCH_POOL_LOCK = threading.Lock()
+
+
+def _get_match_pool():
+    """Returns the shared template-matching thread pool, creating it on first use."""
+    global _MATCH_POOL
+    if _MATCH_POOL is None:
+        with _MATCH_POOL_LOCK:
+            if _MATCH_POOL is None:
+                _MATCH_POOL = concurrent.futures.ThreadPoolExecutor(
+                    max_workers=min(_MATCH_POOL_MAX_WORKERS, os.cpu_count() or 1),
+                    thread_name_prefix="pyauto-match"
+                )
+    return _MATCH_POOL
+
+
+# Result cap of a single-region locateAllOnScreen; merged scans get this per member
+_RESULTS_PER_REGION = 100
+
+
+def _select_member_matches(targets, member_bounds, overlap_threshold):
+    """
+    Reduces the unsuppressed [x, y, w, h, score] matches of a merged scan to those
+    inside one of its member regions, then suppresses overlaps among what is left.
+    Returns (x, y, w, h) tuples sorted top-to-bottom like locateAllOnScreen does.
+    """
+    targets = [
+        rect for rect in targets
+        if any(rect_contains(bounds, rect, tolerance=1) for bounds in member_bounds)
+    ]
+    if overlap_threshold < 1.0 and len(targets) > 1:
+        targets = pyauto_desktop._non_max_suppression(targets, overlap_threshold)
+    targets.sort(key=lambda r: (r[1], r[0]))
+    return [tuple(rect[:4]) for rect in targets]
 
 
 class DetectionWorker(QThread):
     result_signal = pyqtSignal(list, list, list, int)
     text_signal = pyqtSignal(QImage, str)
+    text_batch_signal = pyqtSignal(list)
 
     def __init__(self, mode='image', template_img=None, screen_idx=0, confidence=0.9, grayscale=True,
                  overlap_threshold=0.5, anchor_img=None, anchor_config=None, search_region=None,
                  source_dpr=1.0, source_resolution=None, scaling_type='dpr',
-                 ocr_lang='en-US', ocr_mode='clean', use_det=False, text_rect=None, text_offsets=None):
+                 ocr_lang='en-US', ocr_mode='clean', use_det=False, text_rect=None, text_offsets=None,
+                 text_rects_list=None):
 
         super().__init__()
         self.mode = mode
@@ -36,13 +83,71 @@ class DetectionWorker(QThread):
         self.use_det = use_det
         self.text_rect = text_rect
         self.text_offsets = text_offsets
+        self.text_rects_list = text_rects_list
+        self._preview_scratch = None
 
     def run(self):
         if self.mode == 'text':
-            self.run_text_extraction()
+            if self.text_rects_list:
+                self.run_batch_text_extraction()
+            else:
+                self.run_text_extraction()
         else:
             self.run_image_detection()
 
+    def _locate_text_origin(self, session):
+        """
+        Returns the (x, y) that text rects are relative to: the first anchor match
+        in anchor mode, otherwise the screen origin. None if the anchor is missing.
+        """
+        if not (self.anchor_img and self.anchor_config):
+            return 0, 0
+
+        anchors_iter = session.locateAllOnScreen(
+            image=self.anchor_img,
+            grayscale=self.grayscale,
+            confidence=self.confidence,
+            overlap_threshold=self.overlap_threshold,
+            region=self.search_region,
+            scaling_type=self.scaling_type
+        )
+        anchors_list = list(anchors_iter)
+
+        if not anchors_list:
+            return None
+        ax, ay = anchors_list[0][:2]
+        return ax, ay
+
+    def _capture_text_region(self, session, region):
+        """
+        Captures 'region' grown by the text offsets.
+        Returns (img_data, preview QImage), or (None, None) on capture failure.
+        """
+        fx, fy, fw, fh = region
+        top, bottom, left, right = self.text_offsets
+
+        adj_x = fx - left
+        adj_y = fy - top
+        adj_w = fw + left + right
+        adj_h = fh + top + bottom
+
+        capture_region = (adj_x, adj_y, adj_w, adj_h)
+
+        img_data, _, _, _ = session._prepare_capture(capture_region)
+
+        if img_data is None or img_data.size == 0:
+            return None, None
+
+        # The QImage is deep-copied below, so one RGBA scratch serves every capture
+        if self._preview_scratch is None or self._preview_scratch.shape != img_data.shape:
+            self._preview_scratch = np.empty_like(img_data)
+        preview_img = cv2.cvtColor(img_data, cv2.COLOR_BGRA2RGBA, dst=self._preview_scratch)
+        h, w, ch = preview_img.shape
+        bytes_per_line = ch * w
+        q_img = QImage(preview_img.data, w, h, bytes_per_line, QImage.Format.Format_RGBA8888)
+
+        return img_data, q_img.copy()
+
     def run_text_extraction(self):
         try:
             session = pyauto_desktop.Session(
@@ -52,63 +157,25 @@ class DetectionWorker(QThread):
             )
 
             monitors = pyauto_desktop.get_monitors_safe()
-            if self.screen_idx < len(monitors):
-                selected_screen = monitors[self.screen_idx]
-            else:
+            if self.screen_idx >= len(monitors):
                 return
 
-            final_region = None
-
-            if self.anchor_img and self.anchor_config and self.text_rect:
-                anchors_iter = session.locateAllOnScreen(
-                    image=self.anchor_img,
-                    grayscale=self.grayscale,
-                    confidence=self.confidence,
-                    overlap_threshold=self.overlap_threshold,
-                    region=self.search_region,
-                    scaling_type=self.scaling_type
-                )
-                anchors_list = list(anchors_iter)
-
-                if anchors_list:
-                    ax, ay, aw, ah = anchors_list[0][:4]
-                    rel_x, rel_y, w, h = self.text_rect
-
-                    final_x = ax + rel_x
-                    final_y = ay + rel_y
-                    final_region = (final_x, final_y, w, h)
-                else:
-                    self.text_signal.emit(QImage(), "Anchor not found")
-                    return
-            else:
-                final_region = self.text_rect
-
-            if not final_region:
+            if not self.text_rect:
                 self.text_signal.emit(QImage(), "No region defined")
                 return
 
-            fx, fy, fw, fh = final_region
-            top, bottom, left, right = self.text_offsets
-
-            adj_x = fx - left
-            adj_y = fy - top
-            adj_w = fw + left + right
-            adj_h = fh + top + bottom
-
-            capture_region = (adj_x, adj_y, adj_w, adj_h)
+            origin = self._locate_text_origin(session)
+            if origin is None:
+                self.text_signal.emit(QImage(), "Anchor not found")
+                return
 
-            img_data, _, _, _ = session._prepare_capture(capture_region)
+            final_region = local_to_global(self.text_rect, origin)
+            img_data, q_img = self._capture_text_region(session, final_region)
 
-            if img_data is None or img_data.size == 0:
+            if img_data is None:
                 self.text_signal.emit(QImage(), "Capture Error")
                 return
 
-            img_data_copy = img_data.copy()
-            preview_img = cv2.cvtColor(img_data_copy, cv2.COLOR_BGRA2RGBA)
-            h, w, ch = preview_img.shape
-            bytes_per_line = ch * w
-            q_img = QImage(preview_img.data, w, h, bytes_per_line, QImage.Format.Format_RGBA8888)
-
             try:
                 lines = text_recognition.get_text_from_image(
                     img_data,
@@ -119,12 +186,58 @@ class DetectionWorker(QThread):
             except Exception as e:
                 full_text = f"OCR Error: {e}"
 
-            self.text_signal.emit(q_img.copy(), full_text)
+            self.text_signal.emit(q_img, full_text)
 
         except Exception as e:
             traceback.print_exc()
             self.text_signal.emit(QImage(), f"Error: {str(e)}")
 
+    def run_batch_text_extraction(self):
+        """
+        Reads every rect in text_rects_list with one Session, one anchor lookup and
+        one batched OCR pass, then emits text_batch_signal with [(QImage, str), ...]
+        in the same order. Failed captures yield (QImage(), "Capture Error").
+        """
+        try:
+            session = pyauto_desktop.Session(
+                screen=self.screen_idx,
+                source_resolution=self.source_resolution,
+                source_dpr=self.source_dpr
+            )
+
+            monitors = pyauto_desktop.get_monitors_safe()
+            if self.screen_idx >= len(monitors):
+                return
+
+            origin = self._locate_text_origin(session)
+            if origin is None:
+                self.text_batch_signal.emit([(QImage(), "Anchor not found")] * len(self.text_rects_list))
+                return
+
+            captures = []
+            for rect in self.text_rects_list:
+                captures.append(self._capture_text_region(session, local_to_global(rect, origin)))
+
+            valid = [img_data for img_data, _ in captures if img_data is not None]
+            lines_iter = iter(text_recognition.get_text_from_images(
+                valid,
+                mode=self.ocr_mode,
+                use_det=self.use_det
+            ))
+
+            results = []
+            for img_data, q_img in captures:
+                if img_data is None:
+                    results.append((QImage(), "Capture Error"))
+                else:
+                    results.append((q_img, "\n".join(next(lines_iter))))
+
+            self.text_batch_signal.emit(results)
+
+        except Exception as e:
+            traceback.print_exc()
+            self.text_batch_signal.emit([(QImage(), f"Error: {str(e)}")] * len(self.text_rects_list))
+
     def run_image_detection(self):
         try:
             final_rects = []
@@ -163,6 +276,9 @@ class DetectionWorker(QThread):
                         scale_x = tr_w / sr_w
                         scale_y = tr_h / sr_h
 
+            # Decoded once per run and shared by every search below
+            template = session.prepare_template(self.template_img, grayscale=self.grayscale)
+
             if self.anchor_img and self.anchor_config:
                 anchors_iter = session.locateAllOnScreen(
                     image=self.anchor_img,
@@ -178,37 +294,60 @@ class DetectionWorker(QThread):
                 margin_x = self.anchor_config.get('margin_x', 0)
                 margin_y = self.anchor_config.get('margin_y', 0)
 
-                for (ax, ay, aw, ah) in anchors_list:
-                    rel_rect_with_margin = global_to_local(
-                        (self.anchor_config['offset_x'], self.anchor_config['offset_y'], 0, 0),
-                        (margin_x, margin_y)
-                    )
-                    region_x, region_y, _, _ = local_to_global(
-                        rel_rect_with_margin, (ax, ay)
-                    )
-
-                    region_w = self.anchor_config['w'] + (margin_x * 2)
-                    region_h = self.anchor_config['h'] + (margin_y * 2)
-                    if region_w <= 0 or region_h <= 0:
-                        continue
-
-                    scanned_regions.append((region_x, region_y, region_w, region_h))
-                    mx, my, mw, mh = selected_screen
-                    local_search_region = global_to_local(
-                        (region_x, region_y, region_w, region_h), (mx, my)
-                    )
+                region_w = self.anchor_config['w'] + (margin_x * 2)
+                region_h = self.anchor_config['h'] + (margin_y * 2)
 
-                    targets = session.locateAllOnScreen(
-                        image=self.template_img,
-                        region=local_search_region,
-                        grayscale=self.grayscale,
-                        confidence=self.confidence,
-                        overlap_threshold=self.overlap_threshold,
-                        scaling_type=self.scaling_type
+                if anchors_list and region_w > 0 and region_h > 0:
+                    # Region origins for every anchor at once: anchor + offset - margin,
+                    # then shifted by the monitor origin for the screen-local search.
+                    region_origins = np.asarray(anchors_list)[:, :2] + (
+                        self.anchor_config['offset_x'] - margin_x,
+                        self.anchor_config['offset_y'] - margin_y
                     )
-                    for rect in targets:
-                        final_rects.append(rect)
-                    final_rects.extend(list(targets))
+                    mx, my, mw, mh = selected_screen
+                    local_origins = region_origins - (mx, my)
+
+                    scanned_regions = [(rx, ry, region_w, region_h) for rx, ry in region_origins.tolist()]
+                    local_regions = [(lx, ly, region_w, region_h) for lx, ly in local_origins.tolist()]
+
+                    # Neighbouring anchors often yield overlapping regions; scan each
+                    # merged area once and keep only matches inside a member region.
+                    merged_regions = merge_overlapping_rects(local_regions)
+
+                    def scan(merged):
+                        region, members = merged
+                        # A merged scan still keeps only local peaks, but suppression
+                        # waits until its matches are assigned to member regions, and
+                        # its result cap grows with the member count.
+                        is_merged = len(members) > 1
+                        return session.locateAllOnScreen(
+                            image=template,
+                            region=region,
+                            grayscale=self.grayscale,
+                            confidence=self.confidence,
+                            overlap_threshold=self.overlap_threshold,
+                            scaling_type=self.scaling_type,
+                            return_conf=is_merged,
+                            max_results=_RESULTS_PER_REGION * len(members),
+                            suppress=not is_merged
+                        )
+
+                    if len(merged_regions) > 1:
+                        results = list(_get_match_pool().map(scan, merged_regions))
+                    else:
+                        results = [scan(merged) for merged in merged_regions]
+
+                    for (_, members), targets in zip(merged_regions, results):
+                        if len(members) == 1:
+                            final_rects += targets
+                            continue
+
+                        # Results come back in the scaled capture space of the session
+                        member_bounds = [
+                            (lx * scale_x, ly * scale_y, lw * scale_x, lh * scale_y)
+                            for lx, ly, lw, lh in (local_regions[m] for m in members)
+                        ]
+                        final_rects += _select_member_matches(targets, member_bounds, self.overlap_threshold)
 
             else:
                 if self.search_region:
@@ -222,7 +361,7 @@ class DetectionWorker(QThread):
                     scanned_regions.append(scaled_region)
 
                 rects = session.locateAllOnScreen(
-                    image=self.template_img,
+                    image=template,
                     region=self.search_region,
                     grayscale=self.grayscale,
                     confidence=self.confidence,
@@ -187,33 +187,30 @@ def _load_image(img):
 
 
 def _non_max_suppression(boxes, overlap_thresh):
+    """
+    Keeps the best-scoring box of every overlapping cluster of [x, y, w, h, score] boxes.
+    Runs entirely inside OpenCV (cv2.dnn.NMSBoxes).
+    """
     with PerformanceTimer("Non-Max Suppression"):
         if len(boxes) == 0:
             return []
 
-        boxes_np = np.array(boxes, dtype=np.float32)
-        x1 = boxes_np[:, 0]
-        y1 = boxes_np[:, 1]
-        x2 = boxes_np[:, 0] + boxes_np[:, 2]
-        y2 = boxes_np[:, 1] + boxes_np[:, 3]
-        area = (x2 - x1 + 1) * (y2 - y1 + 1)
-        idxs = np.argsort(y2)
-        pick = []
-
-        while len(idxs) > 0:
-            last = len(idxs) - 1
-            i = idxs[last]
-            pick.append(i)
-            xx1 = np.maximum(x1[i], x1[idxs[:last]])
-            yy1 = np.maximum(y1[i], y1[idxs[:last]])
-            xx2 = np.minimum(x2[i], x2[idxs[:last]])
-            yy2 = np.minimum(y2[i], y2[idxs[:last]])
-            w = np.maximum(0, xx2 - xx1 + 1)
-            h = np.maximum(0, yy2 - yy1 + 1)
-            overlap = (w * h) / area[idxs[:last]]
-            idxs = np.delete(idxs, np.concatenate(([last], np.where(overlap > overlap_thresh)[0])))
-
-        return [boxes[i] for i in pick]
+        boxes_np = np.array([b[:5] for b in boxes], dtype=np.float32)
+        if boxes_np.shape[1] > 4:
+            scores = boxes_np[:, 4]
+        else:
+            scores = np.ones(len(boxes), dtype=np.float32)
+
+        # NMSBoxes needs non-negative scores and drops those not above the threshold,
+        # so rank on a shifted copy.
+        scores = scores - scores.min() + 1.0
+
+        # overlap_thresh is intersection over the other box's area. All matches share
+        # the needle's size, where that ratio t corresponds to IoU = t / (2 - t).
+        iou_thresh = overlap_thresh / (2.0 - overlap_thresh)
+
+        pick = cv2.dnn.NMSBoxes(boxes_np[:, :4], scores, 0.0, iou_thresh)
+        return [boxes[i] for i in np.asarray(pick).flatten()]
 
 
 @lru_cache(maxsize=128)
@@ -224,10 +221,8 @@ def _load_cached_needle(image_path, scale_factor, grayscale):
         return _process_needle_to_cv2(img, scale_factor, grayscale)
 
 
-def _process_needle_to_cv2(img_pil, scale_factor, grayscale):
-    """
-    Converts PIL image to OpenCV format, resizes it using cv2.resize, and handles alpha masks/grayscale.
-    """
+def _decode_needle(img_pil):
+    """Converts a PIL image to an OpenCV BGR/BGRA array."""
     if img_pil.mode not in ('RGB', 'RGBA', 'L'):
         img_pil = img_pil.convert('RGBA')
 
@@ -250,6 +245,21 @@ def _process_needle_to_cv2(img_pil, scale_factor, grayscale):
             else:
                 needle = needle_np
 
+    return needle
+
+
+def _process_needle_to_cv2(img_pil, scale_factor, grayscale):
+    """
+    Converts PIL image to OpenCV format, resizes it using cv2.resize, and handles alpha masks/grayscale.
+    Arrays from Session.prepare_template are already decoded and skip the conversion.
+    """
+    if isinstance(img_pil, np.ndarray):
+        needle = img_pil
+        if len(needle.shape) == 2 and not grayscale:
+            needle = cv2.cvtColor(needle, cv2.COLOR_GRAY2BGR)
+    else:
+        needle = _decode_needle(img_pil)
+
     scale_x, scale_y = 1.0, 1.0
     if isinstance(scale_factor, (tuple, list)):
         scale_x, scale_y = scale_factor
@@ -320,6 +330,8 @@ def _run_template_match(needleImage, haystackImage, grayscale=False, scale_facto
         needle_pil = _load_image(needleImage)
         needle, mask = _process_needle_to_cv2(needle_pil, scale_factor, grayscale)
 
+    # No separate FFT path for large needles: OpenCV's CPU matchTemplate already
+    # correlates via block-wise DFT and normalises with integral images.
     method = None
     needle_blur = cv2.GaussianBlur(needle, (5, 5), 0)
     haystack_blur = cv2.GaussianBlur(haystack, (5, 5), 0)
@@ -341,13 +353,16 @@ def _get_image_size(image):
                 return img.size
         except:
             return (0, 0)
+    elif isinstance(image, np.ndarray):
+        h, w = image.shape[:2]
+        return (w, h)
     elif hasattr(image, 'size'):
         return image.size
     return (0, 0)
 
 
 def _locate_all_pyramid(needleImage, haystackImage, grayscale, confidence, overlap_threshold, scale_factor, downscale,
-                        return_conf=False):
+                        return_conf=False, max_candidates=200, suppress=True):
     sf_x, sf_y = 1.0, 1.0
     if isinstance(scale_factor, (tuple, list)):
         sf_x, sf_y = scale_factor
@@ -434,7 +449,7 @@ def _locate_all_pyramid(needleImage, haystackImage, grayscale, confidence, overl
 
     candidate_count = len(loc[0])
 
-    if candidate_count > 200:
+    if candidate_count > max_candidates:
         if DEBUG_LEVEL >= 2:
             print(f"[PERF] Pyramid Abort: Too many candidates ({candidate_count})")
         return None
@@ -449,14 +464,14 @@ def _locate_all_pyramid(needleImage, haystackImage, grayscale, confidence, overl
         padding = int(16 * max(sf_x, sf_y))
         w_f, h_f = fine_needle.shape[1], fine_needle.shape[0]
 
-        for pt in coarse_points:
-            x_small, y_small = pt
+        w_orig_approx = int(w_s * downscale)
+        h_orig_approx = int(h_s * downscale)
+
+        rois = []
+        for x_small, y_small in coarse_points:
             x_orig_center = int(x_small * downscale)
             y_orig_center = int(y_small * downscale)
 
-            w_orig_approx = int(w_s * downscale)
-            h_orig_approx = int(h_s * downscale)
-
             roi_x1 = max(0, x_orig_center - padding)
             roi_y1 = max(0, y_orig_center - padding)
             roi_x2 = min(w_full, x_orig_center + w_orig_approx + padding)
@@ -464,9 +479,21 @@ def _locate_all_pyramid(needleImage, haystackImage, grayscale, confidence, overl
 
             if roi_x2 <= roi_x1 or roi_y2 <= roi_y1:
                 continue
-
-            haystack_crop = haystack_full[roi_y1:roi_y2, roi_x1:roi_x2]
-            haystack_crop_blur = cv2.GaussianBlur(haystack_crop, (3, 3), 0)
+            rois.append((roi_x1, roi_y1, roi_x2, roi_y2))
+
+        # Neighbouring candidates share most of their windows; once the windows add
+        # up to the whole haystack, blurring it once beats re-blurring every crop.
+        roi_area = sum((x2 - x1) * (y2 - y1) for x1, y1, x2, y2 in rois)
+        haystack_full_blur = None
+        if roi_area >= w_full * h_full:
+            haystack_full_blur = cv2.GaussianBlur(haystack_full, (3, 3), 0)
+
+        for roi_x1, roi_y1, roi_x2, roi_y2 in rois:
+            if haystack_full_blur is not None:
+                haystack_crop_blur = haystack_full_blur[roi_y1:roi_y2, roi_x1:roi_x2]
+            else:
+                haystack_crop = haystack_full[roi_y1:roi_y2, roi_x1:roi_x2]
+                haystack_crop_blur = cv2.GaussianBlur(haystack_crop, (3, 3), 0)
 
             if fine_method == cv2.TM_SQDIFF_NORMED:
                 res_fine = cv2.matchTemplate(haystack_crop_blur, fine_needle_blur, fine_method, mask=fine_mask)
@@ -485,7 +512,7 @@ def _locate_all_pyramid(needleImage, haystackImage, grayscale, confidence, overl
                 verified_rects.append([final_x, final_y, w_f, h_f, match_val])
 
     if len(verified_rects) > 0:
-        if overlap_threshold < 1.0:
+        if suppress and overlap_threshold < 1.0:
             verified_rects = _non_max_suppression(verified_rects, overlap_threshold)
 
         verified_rects.sort(key=lambda r: (r[1], r[0]))
@@ -499,9 +526,14 @@ def _locate_all_pyramid(needleImage, haystackImage, grayscale, confidence, overl
 
 
 def _core_locate_all(needleImage, haystackImage, grayscale=False, confidence=0.9, overlap_threshold=0.5,
-                     scale_factor=1.0, downscale=1, use_pyramid=True, return_conf=False):
+                     scale_factor=1.0, downscale=1, use_pyramid=True, return_conf=False, max_results=100,
+                     suppress=True):
     """
     Core logic: Locate all instances of 'needleImage' inside 'haystackImage'.
+    At most 'max_results' matches are kept; the pyramid search falls back to the
+    full-resolution one beyond twice as many coarse candidates.
+    With suppress=False the final non-max suppression is left to the caller, while
+    the local-peak pre-filter still applies for overlap_threshold < 1.0.
     """
 
     if use_pyramid and downscale > 1:
@@ -515,11 +547,12 @@ def _core_locate_all(needleImage, haystackImage, grayscale=False, confidence=0.9
 
         if downscale >= 1.3:
             ret = _locate_all_pyramid(needleImage, haystackImage, grayscale, confidence, overlap_threshold,
-                                      scale_factor, downscale, return_conf)
+                                      scale_factor, downscale, return_conf, max_candidates=2 * max_results,
+                                      suppress=suppress)
             if ret is not None:
                 return ret
 
-    limit = 100
+    limit = max_results
     if haystackImage is None or haystackImage.size == 0:
         print(f"No haystack image found {haystackImage}")
         return []
@@ -568,7 +601,7 @@ def _core_locate_all(needleImage, haystackImage, grayscale=False, confidence=0.9
             score = float(normalized_scores[i])
             rects.append([x, y, int(w), int(h), score])
 
-        if overlap_threshold < 1.0 and len(rects) > 1:
+        if suppress and overlap_threshold < 1.0 and len(rects) > 1:
             rects = _non_max_suppression(rects, overlap_threshold)
 
         rects.sort(key=lambda r: (r[1], r[0]))
@@ -655,7 +688,8 @@ class Session:
                     if not sct: raise Exception("MSS Init Failed")
 
                     shot = sct.grab(monitor_dict)
-                    sct_img = np.array(shot)
+                    # Each grab owns a fresh BGRA bytearray, so view it instead of copying
+                    sct_img = np.asarray(shot)
                 except Exception as e:
                     if DEBUG_LEVEL >= 1:
                         print(f"!!! MSS FAIL | GDI: {gdi} | Err: {e}")
@@ -676,10 +710,27 @@ class Session:
 
             return sct_img, capture_left - monitor_left, capture_top - monitor_top, scale_factor
 
+    def prepare_template(self, image, grayscale=False):
+        """
+        Decodes a template once so repeated searches with it skip the PIL -> OpenCV
+        conversion. Pass the result as 'image' to locateAllOnScreen/locateOnScreen
+        with the same 'grayscale' setting. File paths are returned unchanged since
+        they are already cached per scale.
+        """
+        if isinstance(image, (str, np.ndarray)):
+            return image
+
+        with PerformanceTimer("Prepare Template"):
+            needle = _decode_needle(image)
+            if grayscale and len(needle.shape) == 3:
+                code = cv2.COLOR_BGRA2GRAY if needle.shape[2] == 4 else cv2.COLOR_BGR2GRAY
+                needle = cv2.cvtColor(needle, code)
+            return needle
+
     def locateAllOnScreen(self, image, region=None, grayscale=False, confidence=0.9, overlap_threshold=0.5,
                           scaling_type=None, source_resolution=None, source_dpr=None, time_out=0, downscale=3,
                           use_pyramid=True,
-                          return_conf=False):
+                          return_conf=False, max_results=100, suppress=True):
         """
         Locate all instances of 'image' on the Session's screen.
         'screen' param is NOT available here; it is enforced by the Session.
@@ -742,7 +793,8 @@ class Session:
 
                 rects = _core_locate_all(image, haystack_img, grayscale, confidence, overlap_threshold,
                                          scale_factor=final_scale_factor, downscale=downscale,
-                                         use_pyramid=use_pyramid, return_conf=return_conf)
+                                         use_pyramid=use_pyramid, return_conf=return_conf,
+                                         max_results=max_results, suppress=suppress)
 
                 if DEBUG_LEVEL >= 2: print(f'======== {rects}')
                 if rects:
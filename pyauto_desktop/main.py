@@ -13,6 +13,7 @@ from .editor import MagicWandEditor
 from .utils import logical_to_physical, physical_to_logical
 from .functions import get_monitors_safe, Session
 from .ui_setup import InspectorUI
+from . import text_recognition
 
 if sys.platform == "win32":
     import ctypes
@@ -96,6 +97,7 @@ class MainWindow(InspectorUI):
             is_text_mode = (index == 1)
 
             if is_text_mode:
+                text_recognition.warm_up_engine()
                 self.chk_anchor_mode.setChecked(False)
                 self.chk_anchor_mode.setEnabled(False)
                 self.chk_anchor_mode.setToolTip("Anchor mode is disabled in Text Extract mode.")
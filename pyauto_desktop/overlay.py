@@ -1,12 +1,22 @@
 import logging
 from typing import List, Tuple, Optional
 
+import numpy as np
 from PyQt6.QtWidgets import QWidget, QApplication
 from PyQt6.QtCore import Qt, QRect, QPoint
-from PyQt6.QtGui import QPainter, QColor, QPen, QBrush, QFont, QPaintEvent
+from PyQt6.QtGui import QPainter, QColor, QPen, QBrush, QFont, QFontMetrics, QPaintEvent
 
 from .functions import get_monitors_safe, get_monitor_dpr
-from .utils import local_to_global
+
+# Outline pens are 2px wide; bounds grow by that much so antialiased strokes
+# straddling a rect's edge stay inside the repainted area
+_PEN_MARGIN = 2
+_DOT_RADIUS = 4
+
+
+def _dot_rect(center: QPoint) -> QRect:
+    return QRect(center.x() - _DOT_RADIUS, center.y() - _DOT_RADIUS,
+                 2 * _DOT_RADIUS + 1, 2 * _DOT_RADIUS + 1)
 
 
 class Overlay(QWidget):
@@ -40,6 +50,14 @@ class Overlay(QWidget):
 
         self.font_idx = QFont("Arial", 10, QFont.Weight.Bold)
 
+        # Global position of the widget's (0, 0); refreshed whenever geometry changes
+        self._origin_global: QPoint = QPoint(0, 0)
+
+        # Widget-space geometry of the current results (None = rebuild on paint)
+        # and the area it covers, so updates only repaint what changed
+        self._layout: Optional[dict] = None
+        self._last_bounds: QRect = QRect()
+
     def _update_geometry(self):
         screens = QApplication.screens()
         if screens:
@@ -49,27 +67,55 @@ class Overlay(QWidget):
             self.setGeometry(full_rect)
         else:
             self.setGeometry(QApplication.primaryScreen().geometry())
+        self._origin_global = self.mapToGlobal(QPoint(0, 0))
+        self._layout = None
 
     def showEvent(self, event):
         super().showEvent(event)
         self._update_geometry()
 
+    def moveEvent(self, event):
+        super().moveEvent(event)
+        self._origin_global = self.mapToGlobal(QPoint(0, 0))
+        self._layout = None
+
     def set_target_screen_offset(self, x: int, y: int):
         self.target_offset_x = x
         self.target_offset_y = y
+        # Rebuilt by the update_rects call that follows, or lazily on the next paint
+        self._layout = None
 
     def set_click_config(self, show: bool, off_x: int, off_y: int):
         self.show_click = show
         self.click_offset_x = off_x
         self.click_offset_y = off_y
-        self.update()
+        self._refresh_layout()
 
     def update_rects(self, rects: list, anchors: list, regions: list, scale_factor: float):
         self.rects = rects
         self.anchors = anchors
         self.regions = regions
         self.scale_factor = scale_factor
-        self.update()
+        self._refresh_layout()
+
+    def _refresh_layout(self):
+        """
+        Rebuilds the cached layout and repaints only the area covered by the
+        previous and the new content, rather than the whole multi-monitor overlay.
+        Clearing the last results therefore repaints just where they were drawn.
+        """
+        old_bounds = self._last_bounds
+        try:
+            self._layout, self._last_bounds = self._build_layout()
+        except Exception as e:
+            print(f"Overlay layout error: {e}")
+            self._layout, self._last_bounds = None, QRect()
+            self.update()
+            return
+
+        dirty = old_bounds.united(self._last_bounds)
+        if not dirty.isEmpty():
+            self.update(dirty)
 
     def _get_matching_monitor(self, monitor_list: list, tx: int, ty: int) -> Optional[tuple]:
         for i, monitor in enumerate(monitor_list):
@@ -77,14 +123,59 @@ class Overlay(QWidget):
                 return i, monitor
         return None
 
+    def _build_layout(self):
+        """
+        Computes everything paintEvent draws, in widget coordinates.
+        Returns ({group: (boxes, labels, dots)}, bounds), where bounds is the union
+        of all of it grown by the pen width, or an empty QRect if nothing is drawn.
+        """
+        layout = {}
+        bounds = QRect()
+        if not (self.rects or self.anchors or self.regions):
+            return layout, bounds
+
+        monitors = get_monitors_safe()
+        match = self._get_matching_monitor(monitors, self.target_offset_x, self.target_offset_y)
+        if not match:
+            return layout, bounds
+
+        _idxscreen, selected_monitor = match
+        dpr = self.devicePixelRatioF()
+        scaling = self.scale_factor / get_monitor_dpr(_idxscreen, monitors)
+        fm = QFontMetrics(self.font_idx, self)
+
+        groups = (
+            ('region', self.regions, None),
+            ('anchor', self.anchors, "A"),
+            ('box', self.rects, "#"),
+        )
+        for name, rect_list, label_prefix in groups:
+            if not rect_list:
+                continue
+            boxes, labels, dots, group_bounds = self._build_group(
+                rect_list, selected_monitor, dpr, scaling, fm, label_prefix,
+                show_click=(name == 'box' and self.show_click)
+            )
+            layout[name] = (boxes, labels, dots)
+            bounds = bounds.united(group_bounds)
+
+        if bounds.isEmpty():
+            return layout, QRect()
+        return layout, bounds.adjusted(-_PEN_MARGIN, -_PEN_MARGIN, _PEN_MARGIN, _PEN_MARGIN)
+
     def paintEvent(self, event: QPaintEvent):
         if not (self.rects or self.anchors or self.regions):
             return
 
         try:
+            if self._layout is None:
+                self._layout, self._last_bounds = self._build_layout()
+
+            dirty = event.rect()
             painter = QPainter(self)
             painter.setRenderHint(QPainter.RenderHint.Antialiasing)
             painter.setFont(self.font_idx)
+            painter.setClipRect(dirty)
 
             styles = {
                 'box': {
@@ -113,97 +204,92 @@ class Overlay(QWidget):
             styles['anchor']['pen'].setStyle(Qt.PenStyle.DashLine)
             styles['region']['pen'].setStyle(Qt.PenStyle.DotLine)
 
-            monitors = get_monitors_safe()
-
-            if self.regions:
-                self._draw_element_group(
-                    painter, self.regions, monitors, styles['region'], styles['text'],
-                    label_prefix="R", is_region=True
-                )
-
-            if self.anchors:
-                self._draw_element_group(
-                    painter, self.anchors, monitors, styles['anchor'], styles['text'],
-                    label_prefix="A", is_anchor=True
-                )
-
-            if self.rects:
-                self._draw_element_group(
-                    painter, self.rects, monitors, styles['box'], styles['text'],
-                    label_prefix="#", click_style=styles['click_dot']
-                )
+            for name in ('region', 'anchor', 'box'):
+                group = self._layout.get(name)
+                if group:
+                    self._draw_element_group(
+                        painter, group, dirty, styles[name], styles['text'],
+                        is_anchor=(name == 'anchor'), click_style=styles['click_dot']
+                    )
 
         except Exception as e:
             print(f"Overlay paint error: {e}")
 
-    def _draw_element_group(self, painter: QPainter, rect_list: list, monitors: list,
-                            style: dict, text_style: dict, label_prefix: str,
-                            is_anchor: bool = False, is_region: bool = False, click_style: dict = None):
-        painter.setPen(style['pen'])
-        painter.setBrush(style['brush'])
-
-        _idxscreen, selected_monitor = self._get_matching_monitor(monitors, self.target_offset_x, self.target_offset_y)
-
-        if not selected_monitor:
-            return
-
-        dpr = self.devicePixelRatioF()
-        for i, (x, y, w, h) in enumerate(rect_list):
-            gx, gy, _, _ = local_to_global((x, y, w, h), (self.target_offset_x, self.target_offset_y))
-            global_point = QPoint(int(gx), int(gy))
-
-            max_x = (x + w) * dpr
-            max_y = (y + h) * dpr
-
-            if x * dpr > selected_monitor[2] or y * dpr > selected_monitor[3]:
-                continue
-            elif x < 0:
-                x = 0
-            elif y < 0:
-                y = 0
-            elif max_x > selected_monitor[2]:
-                w = w - (max_x - selected_monitor[2]) / dpr
-            elif max_y > selected_monitor[3]:
-                h = h - (max_y - selected_monitor[3]) / dpr
-            top_left_local = self.mapFromGlobal(QPoint(int(gx), int(gy)))
-
-            scaling = self.scale_factor/get_monitor_dpr(_idxscreen, monitors)
-
-
-            draw_x = top_left_local.x()
-            draw_y = top_left_local.y()
-            draw_w = int(round(w)/scaling)
-            draw_h = int(round(h)/scaling)
+    def _layout_group(self, rect_list: list, selected_monitor: tuple, dpr: float, scaling: float):
+        """
+        Computes the widget-space geometry of a whole rect group with NumPy.
+        Mapping to widget coordinates is a single translation by the cached overlay
+        origin, so it is applied to every rect at once instead of via mapFromGlobal.
+        Returns parallel lists (index, x, y, draw_x, draw_y, draw_w, draw_h) of the
+        rects that fall on the selected monitor; x/y are the clipped local coords.
+        """
+        arr = np.asarray(rect_list, dtype=np.float64).reshape(-1, 4)
+        x, y, w, h = (arr[:, k] for k in range(4))
+        mon_w, mon_h = selected_monitor[2], selected_monitor[3]
+
+        draw_x = (x + self.target_offset_x).astype(np.int64) - self._origin_global.x()
+        draw_y = (y + self.target_offset_y).astype(np.int64) - self._origin_global.y()
+
+        max_x = (x + w) * dpr
+        max_y = (y + h) * dpr
+        visible = ~((x * dpr > mon_w) | (y * dpr > mon_h))
+
+        # Only the first applicable clip is applied, matching the original elif chain
+        clip_x = x < 0
+        clip_y = ~clip_x & (y < 0)
+        clip_w = ~clip_x & ~clip_y & (max_x > mon_w)
+        clip_h = ~clip_x & ~clip_y & ~clip_w & (max_y > mon_h)
+
+        x = np.where(clip_x, 0, x)
+        y = np.where(clip_y, 0, y)
+        w = np.where(clip_w, w - (max_x - mon_w) / dpr, w)
+        h = np.where(clip_h, h - (max_y - mon_h) / dpr, h)
+
+        draw_w = (np.round(w) / scaling).astype(np.int64)
+        draw_h = (np.round(h) / scaling).astype(np.int64)
+
+        keep = np.flatnonzero(visible)
+        return (keep.tolist(), x[keep].tolist(), y[keep].tolist(),
+                draw_x[keep].tolist(), draw_y[keep].tolist(),
+                draw_w[keep].tolist(), draw_h[keep].tolist())
+
+    def _build_group(self, rect_list: list, selected_monitor: tuple, dpr: float, scaling: float,
+                     fm: QFontMetrics, label_prefix: Optional[str], show_click: bool = False):
+        """
+        Turns one rect group into the QRects/QPoints it is drawn with.
+        Returns (boxes, labels, dots, bounds); labels and dots are empty for
+        groups without a label prefix or click preview.
+        """
+        indices, xs, ys, draw_xs, draw_ys, draw_ws, draw_hs = self._layout_group(
+            rect_list, selected_monitor, dpr, scaling
+        )
 
-            painter.drawRect(draw_x, draw_y, draw_w, draw_h)
+        boxes = [QRect(dx, dy, dw, dh) for dx, dy, dw, dh in zip(draw_xs, draw_ys, draw_ws, draw_hs)]
+        bounds = QRect()
+        if boxes:
+            bounds = QRect(QPoint(min(draw_xs), min(draw_ys)),
+                           QPoint(max(dx + dw for dx, dw in zip(draw_xs, draw_ws)),
+                                  max(dy + dh for dy, dh in zip(draw_ys, draw_hs))))
 
-            if is_region:
-                continue
-
-            label_text = f"{label_prefix}{i}"
-            fm = painter.fontMetrics()
-            text_w = fm.horizontalAdvance(label_text) + 8
+        labels = []
+        if label_prefix is not None:
             text_h = fm.height() + 4
-
-            label_x = draw_x
-            label_y = draw_y - text_h
-            if label_y < 0:
-                label_y = draw_y
-
-            painter.save()
-            painter.setPen(Qt.PenStyle.NoPen)
-            painter.setBrush(text_style['bg_brush'])
-            painter.drawRect(label_x, label_y, text_w, text_h)
-            painter.restore()
-
-            painter.save()
-            painter.setPen(text_style['anchor_pen'] if is_anchor else text_style['pen'])
-            painter.setBrush(Qt.BrushStyle.NoBrush)
-            painter.drawText(QRect(label_x, label_y, text_w, text_h),
-                             Qt.AlignmentFlag.AlignCenter, label_text)
-            painter.restore()
-
-            if not is_anchor and not is_region and self.show_click and click_style:
+            for i, draw_x, draw_y in zip(indices, draw_xs, draw_ys):
+                label_text = f"{label_prefix}{i}"
+                text_w = fm.horizontalAdvance(label_text) + 8
+
+                label_x = draw_x
+                label_y = draw_y - text_h
+                if label_y < 0:
+                    label_y = draw_y
+
+                label_rect = QRect(label_x, label_y, text_w, text_h)
+                labels.append((label_rect, label_text))
+                bounds = bounds.united(label_rect)
+
+        dots = []
+        if show_click:
+            for x, y, draw_x, draw_y, draw_w, draw_h in zip(xs, ys, draw_xs, draw_ys, draw_ws, draw_hs):
                 center_x = draw_x + (draw_w / 2)
                 center_y = draw_y + (draw_h / 2)
 
@@ -221,10 +307,39 @@ class Overlay(QWidget):
                         dpr_target_y < 0):
                     continue
 
-                target_local = QPoint(int(target_x), int(target_y))
+                dot = QPoint(int(target_x), int(target_y))
+                dots.append(dot)
+                bounds = bounds.united(_dot_rect(dot))
+
+        return boxes, labels, dots, bounds
+
+    def _draw_element_group(self, painter: QPainter, group: tuple, dirty: QRect, style: dict,
+                            text_style: dict, is_anchor: bool = False, click_style: dict = None):
+        boxes, labels, dots = group
+        m = _PEN_MARGIN
+
+        # Each pass sets its pen/brush once and hands Qt the batch of items that
+        # intersect the repainted area in one call
+        painter.setPen(style['pen'])
+        painter.setBrush(style['brush'])
+        painter.drawRects([box for box in boxes if box.adjusted(-m, -m, m, m).intersects(dirty)])
+
+        labels = [label for label in labels if label[0].intersects(dirty)]
+        if labels:
+            painter.setPen(Qt.PenStyle.NoPen)
+            painter.setBrush(text_style['bg_brush'])
+            painter.drawRects([label_rect for label_rect, _ in labels])
+
+            painter.setPen(text_style['anchor_pen'] if is_anchor else text_style['pen'])
+            painter.setBrush(Qt.BrushStyle.NoBrush)
+            for label_rect, label_text in labels:
+                painter.drawText(label_rect, Qt.AlignmentFlag.AlignCenter, label_text)
+
+        if not dots or not click_style:
+            return
 
-                painter.save()
-                painter.setPen(click_style['pen'])
-                painter.setBrush(click_style['brush'])
-                painter.drawEllipse(target_local, 4, 4)
-                painter.restore()
\ No newline at end of file
+        painter.setPen(click_style['pen'])
+        painter.setBrush(click_style['brush'])
+        for dot in dots:
+            if _dot_rect(dot).adjusted(-m, -m, m, m).intersects(dirty):
+                painter.drawEllipse(dot, _DOT_RADIUS, _DOT_RADIUS)
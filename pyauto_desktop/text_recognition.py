@@ -1,18 +1,119 @@
 import cv2
 import numpy as np
 import re
+import threading
+from collections import OrderedDict
 from rapidocr import RapidOCR
+from rapidocr.main import RapidOCRError
 
 
 
 _ENGINE_CACHE = {}
+_ENGINE_LOCK = threading.Lock()
+# RapidOCR.__call__ writes use_det/use_cls/... onto the shared engine, so calls
+# coming from different threads (DetectionWorker, Session.read_text) are serialized.
+_CALL_LOCK = threading.Lock()
 
 
 def get_engine():
-    """Returns the cached RapidOCR engine."""
-    if 'fast' not in _ENGINE_CACHE:
-        _ENGINE_CACHE['fast'] = RapidOCR()
-    return _ENGINE_CACHE['fast']
+    """Returns the cached RapidOCR engine, creating it at most once across threads."""
+    engine = _ENGINE_CACHE.get('fast')
+    if engine is None:
+        with _ENGINE_LOCK:
+            if 'fast' not in _ENGINE_CACHE:
+                _ENGINE_CACHE['fast'] = RapidOCR()
+            engine = _ENGINE_CACHE['fast']
+    return engine
+
+
+def warm_up_engine():
+    """
+    Builds the OCR engine on a daemon thread so the first text read doesn't
+    stall for model loading. No-op once the engine exists.
+    """
+    if 'fast' in _ENGINE_CACHE:
+        return
+    threading.Thread(target=get_engine, daemon=True).start()
+
+
+# Upscaling past this height stops improving recognition; RapidOCR's recognizer
+# normalises every line to 48px anyway.
+_TARGET_HEIGHT = 90.0
+# RapidOCR shrinks inputs whose longer side exceeds this (Global.max_side_len).
+_MAX_SIDE_LEN = 2000
+_PADDING = 30
+_MODES = ('clean', 'binarize', 'restore')
+
+# Padded engine inputs are cached at module level for this many input sizes; the
+# GUI runs every detection step on a fresh QThread, so a per-thread cache never hits
+_BORDER_BUF_LIMIT = 4
+_BORDER_BUFS = OrderedDict()
+_BORDER_BUF_LOCK = threading.Lock()
+
+# Fast-path thresholds: crisp UI text is a high-spread, near two-tone image
+_FAST_PATH_MIN_STD = 80
+_FAST_PATH_MIN_BIMODAL = 0.85
+_FAST_PATH_TOLERANCE = 20
+
+# Gamma 0.6 lookup table for the 'restore' mode
+_GAMMA_TABLE = np.array([((i / 255.0) ** (1.0 / 0.6)) * 255 for i in np.arange(0, 256)]).astype("uint8")
+
+
+def _to_gray(img):
+    """Converts a BGR/BGRA capture to single-channel grayscale."""
+    if len(img.shape) == 2:
+        return img
+    code = cv2.COLOR_BGRA2GRAY if img.shape[2] == 4 else cv2.COLOR_BGR2GRAY
+    return cv2.cvtColor(img, code)
+
+
+def _upscale(img, max_scale, interpolation):
+    """
+    Upscales small captures towards _TARGET_HEIGHT (never beyond max_scale) and
+    leaves large ones untouched, so big regions don't pay for a 9-16x buffer.
+    """
+    h, w = img.shape[:2]
+    scale = max(1.0, min(max_scale, _TARGET_HEIGHT / h))
+    scale = min(scale, max(1.0, (_MAX_SIDE_LEN - 2 * _PADDING) / max(h, w)))
+    if scale == 1.0:
+        return img
+    return cv2.resize(img, None, fx=scale, fy=scale, interpolation=interpolation)
+
+
+def _is_high_contrast(gray):
+    """
+    Checks a strided sample for screen-rendered text: a large spread with nearly
+    every pixel close to either the darkest or the brightest sampled value.
+    """
+    sample = gray[::4, ::4]
+    if sample.std() <= _FAST_PATH_MIN_STD:
+        return False
+
+    lo, hi = int(sample.min()), int(sample.max())
+    near_extreme = (sample <= lo + _FAST_PATH_TOLERANCE) | (sample >= hi - _FAST_PATH_TOLERANCE)
+    return np.count_nonzero(near_extreme) > _FAST_PATH_MIN_BIMODAL * sample.size
+
+
+def _acquire_padded(h, w):
+    """
+    Returns a white-bordered BGR buffer for an h x w input. It is taken out of the
+    shared cache, so no other call writes into it until _release_padded hands it back.
+    """
+    shape = (h + 2 * _PADDING, w + 2 * _PADDING, 3)
+    with _BORDER_BUF_LOCK:
+        buf = _BORDER_BUFS.pop(shape, None)
+    if buf is None:
+        buf = np.full(shape, 255, dtype=np.uint8)
+    return buf
+
+
+def _release_padded(buf):
+    """Returns a buffer from _acquire_padded to the cache, dropping the least recently used sizes."""
+    with _BORDER_BUF_LOCK:
+        _BORDER_BUFS[buf.shape] = buf
+        _BORDER_BUFS.move_to_end(buf.shape)
+        while len(_BORDER_BUFS) > _BORDER_BUF_LIMIT:
+            _BORDER_BUFS.popitem(last=False)
 
 
 def preprocess_image(img, mode='clean'):
@@ -21,85 +122,96 @@ def preprocess_image(img, mode='clean'):
     1. 'clean'    -> Upscale, Denoise, CLAHE (General purpose)
     2. 'binarize' -> Color split, High Contrast, Thresholding (Colored/Low contrast text)
     3. 'restore'  -> Sharpening, Gamma Correction, Bilateral Filter (Faded/Damaged text)
+
+    The BGR/BGRA capture is converted to grayscale once, up front, and every mode
+    works from that buffer (binarize additionally weighs its L/V channels), so
+    resize only ever touches a single channel. Returns a padded single-channel
+    uint8 image.
+
+    Captures that are already crisp two-tone text (see _is_high_contrast) skip
+    the pipeline and are only upscaled and padded, for every mode.
     """
+    processed = _preprocess(img, mode)
+    return cv2.copyMakeBorder(
+        processed,
+        top=_PADDING, bottom=_PADDING, left=_PADDING, right=_PADDING,
+        borderType=cv2.BORDER_CONSTANT,
+        value=255
+    )
+
+
+def _preprocess(img, mode):
+    """preprocess_image without the white border, which _to_engine_input adds."""
     if img is None or img.size == 0:
         raise ValueError("Cannot preprocess empty image.")
 
+    if mode not in _MODES:
+        raise ValueError(f"Unknown mode: {mode}. Use 'clean', 'binarize', or 'restore'")
+
+    gray = _to_gray(img)
+    if _is_high_contrast(gray):
+        # Upscaled like 'clean' before padding: the recognizer shrinks each input to
+        # 48px high, so an unscaled small capture would be mostly border
+        return _upscale(gray, 4, cv2.INTER_CUBIC)
+
     processed = None
 
     if mode == 'clean':
-        scale_factor = 4
-        img_large = cv2.resize(img, None, fx=scale_factor, fy=scale_factor, interpolation=cv2.INTER_CUBIC)
-
-        if len(img_large.shape) == 3:
-            gray = cv2.cvtColor(img_large, cv2.COLOR_BGR2GRAY)
-        else:
-            gray = img_large
+        gray = _upscale(gray, 4, cv2.INTER_CUBIC)
 
         gray = cv2.fastNlMeansDenoising(gray, None, 5, 7, 21)
         clahe = cv2.createCLAHE(clipLimit=2.0, tileGridSize=(8, 8))
-        enhanced = clahe.apply(gray)
-        processed = cv2.cvtColor(enhanced, cv2.COLOR_GRAY2BGR)
+        processed = clahe.apply(gray)
 
     elif mode == 'binarize':
-        scale_factor = 4
-        img_large = cv2.resize(img, None, fx=scale_factor, fy=scale_factor, interpolation=cv2.INTER_NEAREST)
-
-        if len(img_large.shape) == 3:
-            lab = cv2.cvtColor(img_large, cv2.COLOR_BGR2LAB)
+        if len(img.shape) == 3:
+            lab = cv2.cvtColor(img, cv2.COLOR_BGR2LAB)
             l_channel = lab[:, :, 0]
-            hsv = cv2.cvtColor(img_large, cv2.COLOR_BGR2HSV)
+            hsv = cv2.cvtColor(img, cv2.COLOR_BGR2HSV)
             v_channel = hsv[:, :, 2]
-            gray = cv2.cvtColor(img_large, cv2.COLOR_BGR2GRAY)
             channels = [l_channel, v_channel, gray]
             contrasts = [np.std(ch) for ch in channels]
             best_channel = channels[np.argmax(contrasts)]
         else:
-            best_channel = img_large
+            best_channel = img
+
+        best_channel = _upscale(np.ascontiguousarray(best_channel), 4, cv2.INTER_NEAREST)
 
         clahe = cv2.createCLAHE(clipLimit=3.0, tileGridSize=(8, 8))
         enhanced = clahe.apply(best_channel)
-        _, processed = cv2.threshold(enhanced, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
-        _, processed_inv = cv2.threshold(enhanced, 0, 255, cv2.THRESH_BINARY_INV + cv2.THRESH_OTSU)
+        _, processed = cv2.threshold(enhanced, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU, dst=enhanced)
 
-        if np.sum(processed_inv == 0) < np.sum(processed == 0):
-            processed = processed_inv
-
-        processed = cv2.cvtColor(processed, cv2.COLOR_GRAY2BGR)
+        # The inverted Otsu result is the exact complement, so prefer it whenever
+        # black outnumbers white instead of thresholding and scanning both images.
+        if 2 * cv2.countNonZero(processed) < processed.size:
+            cv2.bitwise_not(processed, dst=processed)
 
     elif mode == 'restore':
-        scale_factor = 3
-        img_large = cv2.resize(img, None, fx=scale_factor, fy=scale_factor, interpolation=cv2.INTER_CUBIC)
-        if len(img_large.shape) == 3:
-            gray = cv2.cvtColor(img_large, cv2.COLOR_BGR2GRAY)
-        else:
-            gray = img_large
+        gray = _upscale(gray, 3, cv2.INTER_CUBIC)
 
         gaussian = cv2.GaussianBlur(gray, (0, 0), 2.0)
         sharp = cv2.addWeighted(gray, 2.5, gaussian, -1.5, 0)
         norm = cv2.normalize(sharp, None, 0, 255, cv2.NORM_MINMAX)
 
-        gamma = 0.6
-        invGamma = 1.0 / gamma
-        table = np.array([((i / 255.0) ** invGamma) * 255 for i in np.arange(0, 256)]).astype("uint8")
-        gamma_corrected = cv2.LUT(norm, table)
+        gamma_corrected = cv2.LUT(norm, _GAMMA_TABLE)
 
         bilateral = cv2.bilateralFilter(gamma_corrected, 9, 75, 75)
-        _, processed = cv2.threshold(bilateral, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
+        _, processed = cv2.threshold(bilateral, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU, dst=bilateral)
 
-        processed = cv2.cvtColor(processed, cv2.COLOR_GRAY2BGR)
+    return processed
 
-    else:
-        # Fallback/Error for unknown modes
-        raise ValueError(f"Unknown mode: {mode}. Use 'clean', 'binarize', or 'restore'")
 
-    padding = 30
-    return cv2.copyMakeBorder(
-        processed,
-        top=padding, bottom=padding, left=padding, right=padding,
-        borderType=cv2.BORDER_CONSTANT,
-        value=[255, 255, 255]
-    )
+def _to_engine_input(processed):
+    """
+    Writes a preprocessed single-channel image into the centre of a cached white-
+    bordered buffer, as the contiguous 3-channel BGR array RapidOCR consumes as-is.
+    Padding and channel expansion share one cvtColor pass, and RapidOCR's loader
+    runs no conversion of its own. Hand the buffer back with _release_padded.
+    """
+    h, w = processed.shape[:2]
+    buf = _acquire_padded(h, w)
+    cv2.cvtColor(processed, cv2.COLOR_GRAY2BGR, dst=buf[_PADDING:-_PADDING, _PADDING:-_PADDING])
+    return buf
 
 
 def filter_english_only(text):
@@ -122,10 +234,16 @@ def get_text_from_image(image_data, mode='clean', use_det=False):
         raise ValueError("Input image_data is None or empty.")
 
     try:
-        processed_img = preprocess_image(image_data, mode=mode)
+        processed_img = _to_engine_input(_preprocess(image_data, mode))
         engine = get_engine()
 
-        result = engine(processed_img, use_det=use_det, use_cls=True, use_rec=True)
+        try:
+            with _CALL_LOCK:
+                if not use_det:
+                    return _clean_lines(_recognize_crops(engine, [processed_img]))
+                result = engine(processed_img, use_det=True, use_cls=True, use_rec=True)
+        finally:
+            _release_padded(processed_img)
 
         if not result:
             return []
@@ -136,15 +254,66 @@ def get_text_from_image(image_data, mode='clean', use_det=False):
         elif isinstance(result, list):
             raw_lines = result
 
-        extracted_texts = []
-        for line in raw_lines:
-            text = str(line)
-            cleaned_text = filter_english_only(text)
-            if cleaned_text:
-                extracted_texts.append(cleaned_text)
+        return _clean_lines(raw_lines)
 
-        return extracted_texts
+    except Exception as e:
+        print(f"OCR Error: {e}")
+        return []
+
+
+def get_text_from_images(images, mode='clean', use_det=False):
+    """
+    Batched variant of get_text_from_image. Returns one list of lines per image.
+    Without detection, every image goes through RapidOCR's classifier and
+    recognizer in a single batched pass; with use_det each image still needs
+    its own detection run, so they are processed one by one.
+    Batching only pays off once the per-call overhead it amortizes is comparable
+    to the per-image recognition time, i.e. for several small regions.
+    """
+    if use_det:
+        return [get_text_from_image(img, mode=mode, use_det=True) for img in images]
+
+    if not images:
+        return []
+
+    try:
+        processed_imgs = [_to_engine_input(_preprocess(img, mode)) for img in images]
+        engine = get_engine()
+
+        try:
+            with _CALL_LOCK:
+                txts = _recognize_crops(engine, processed_imgs)
+        finally:
+            for processed_img in processed_imgs:
+                _release_padded(processed_img)
+
+        return [_clean_lines([txt]) for txt in txts]
 
     except Exception as e:
         print(f"OCR Error: {e}")
-        return []
\ No newline at end of file
+        return [[] for _ in images]
+
+
+def _recognize_crops(engine, imgs):
+    """
+    Runs RapidOCR's classifier and recognizer directly on already-cropped BGR images
+    and returns one text per image. Without detection, RapidOCR.__call__ would only
+    add parameter writes, a reload/resize of the input and output assembly on top.
+    Both stages raise RapidOCRError on an empty result; like RapidOCR.__call__,
+    that is treated as no text rather than an error.
+    """
+    try:
+        cls_imgs, _ = engine.cls_and_rotate(imgs)
+        return engine.recognize_txt(cls_imgs).txts
+    except RapidOCRError:
+        return [""] * len(imgs)
+
+
+def _clean_lines(raw_lines):
+    extracted_texts = []
+    for line in raw_lines:
+        text = str(line)
+        cleaned_text = filter_english_only(text)
+        if cleaned_text:
+            extracted_texts.append(cleaned_text)
+    return extracted_texts
\ No newline at end of file
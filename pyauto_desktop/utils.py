@@ -21,4 +21,48 @@ def local_to_global(local_rect, screen_origin_logical):
     """Translates screen-local logical coordinates back to global logical coordinates."""
     lx, ly, lw, lh = local_rect
     ox, oy = screen_origin_logical
-    return (lx + ox, ly + oy, lw, lh)
\ No newline at end of file
+    return (lx + ox, ly + oy, lw, lh)
+
+def rect_contains(outer_rect, inner_rect, tolerance=0):
+    """Returns True if inner (x, y, w, h) lies within outer, allowing 'tolerance' pixels of slack."""
+    ox, oy, ow, oh = outer_rect
+    ix, iy, iw, ih = inner_rect[:4]
+    return (ix >= ox - tolerance and iy >= oy - tolerance and
+            ix + iw <= ox + ow + tolerance and iy + ih <= oy + oh + tolerance)
+
+
+def merge_overlapping_rects(rects):
+    """
+    Merges overlapping (x, y, w, h) rects into their bounding boxes, but only when
+    the bounding box is no larger than the two rects' combined area, so scanning
+    the merged rect never costs more pixels than scanning both separately.
+    Kept rects may therefore still overlap. Returns a list of
+    (merged_rect, member_indices) pairs.
+    """
+    merged = []
+    for i, (x, y, w, h) in enumerate(rects):
+        x1, y1, x2, y2, members = x, y, x + w, y + h, [i]
+
+        # Absorb every box the (growing) union can take in without adding area
+        absorbed = True
+        while absorbed:
+            absorbed = False
+            for other in merged:
+                ox1, oy1, ox2, oy2, other_members = other
+                if not (x1 < ox2 and ox1 < x2 and y1 < oy2 and oy1 < y2):
+                    continue
+
+                ux1, uy1 = min(x1, ox1), min(y1, oy1)
+                ux2, uy2 = max(x2, ox2), max(y2, oy2)
+                if (ux2 - ux1) * (uy2 - uy1) > (x2 - x1) * (y2 - y1) + (ox2 - ox1) * (oy2 - oy1):
+                    continue
+
+                x1, y1, x2, y2 = ux1, uy1, ux2, uy2
+                members = other_members + members
+                merged.remove(other)
+                absorbed = True
+                break
+
+        merged.append((x1, y1, x2, y2, members))
+
+    return [((x1, y1, x2 - x1, y2 - y1), sorted(members)) for x1, y1, x2, y2, members in merged]
@@ -0,0 +1,50 @@
+import numpy as np
+import pytest
+
+cv2 = pytest.importorskip("cv2")
+pytest.importorskip("PyQt6")
+
+from pyauto_desktop import functions
+from pyauto_desktop.detection import _RESULTS_PER_REGION, _select_member_matches
+from pyauto_desktop.utils import merge_overlapping_rects
+
+
+def _dense_haystack(seed=0):
+    """A noisy 240x400 capture densely tiled with a low-texture 16px template."""
+    rng = np.random.default_rng(seed)
+    ramp = np.linspace(90, 150, 16, dtype=np.float32)
+    template = np.repeat((ramp[None, :] + ramp[:, None] / 4)[:, :, None], 3, axis=2)
+    template = np.clip(template + rng.normal(0, 3, template.shape), 0, 255).astype(np.uint8)
+
+    haystack = rng.integers(0, 256, (240, 400, 3), dtype=np.uint8)
+    for y in range(2, 240 - 16, 19):
+        for x in range(2, 400 - 16, 19):
+            haystack[y:y + 16, x:x + 16] = template
+    return template, haystack
+
+
+def _locate(template, haystack, region, **kwargs):
+    x, y, w, h = region
+    rects = functions._core_locate_all(template, haystack[y:y + h, x:x + w], confidence=0.8,
+                                       return_conf=True, **kwargs)
+    return [(rx + x, ry + y) + tuple(rest) for rx, ry, *rest in rects]
+
+
+def test_merged_scan_matches_separate_scans():
+    template, haystack = _dense_haystack()
+    regions = [(0, 0, 300, 100), (0, 80, 300, 100)]
+    merged = merge_overlapping_rects(regions)
+    assert len(merged) == 1
+    (merged_region, members), = merged
+
+    separate = []
+    for region in regions:
+        separate += _locate(template, haystack, region)
+    separate = {tuple(r[:4]) for r in functions._non_max_suppression(separate, 0.5)}
+
+    targets = _locate(template, haystack, merged_region, suppress=False,
+                      max_results=_RESULTS_PER_REGION * len(members))
+    combined = set(_select_member_matches(targets, regions, 0.5))
+
+    assert len(separate) > _RESULTS_PER_REGION
+    assert combined == separate
@@ -0,0 +1,42 @@
+import numpy as np
+import pytest
+
+cv2 = pytest.importorskip("cv2")
+pytest.importorskip("rapidocr")
+
+from pyauto_desktop import text_recognition
+
+
+PHRASES = ["Submit order now", "Download 2048 MB", "Settings", "Cancel", "Save changes"]
+
+
+def _render_ui_text(text, height, dark=False):
+    """Renders bold aliased (two-tone) text into a tightly cropped capture 'height' pixels tall."""
+    font = cv2.FONT_HERSHEY_SIMPLEX
+    scale = height / 30.0
+    thickness = max(1, height // 10)
+    (text_w, text_h), _ = cv2.getTextSize(text, font, scale, thickness)
+
+    bg, fg = ((30, 30, 30), (240, 240, 240)) if dark else ((245, 245, 245), (20, 20, 20))
+    img = np.full((height, text_w + 4, 3), bg, dtype=np.uint8)
+    cv2.putText(img, text, (2, (height + text_h) // 2), font, scale, fg, thickness, cv2.LINE_8)
+    return img
+
+
+@pytest.mark.parametrize("height", [24, 30, 40, 60])
+@pytest.mark.parametrize("dark", [False, True])
+def test_fast_path_reads_match_full_pipeline(monkeypatch, height, dark):
+    captures = [_render_ui_text(text, height, dark) for text in PHRASES]
+    assert all(text_recognition._is_high_contrast(text_recognition._to_gray(img)) for img in captures)
+
+    fast_reads = [text_recognition.get_text_from_image(img) for img in captures]
+
+    monkeypatch.setattr(text_recognition, "_is_high_contrast", lambda gray: False)
+    full_reads = [text_recognition.get_text_from_image(img) for img in captures]
+
+    assert fast_reads == full_reads
+
+
+def test_unknown_mode_raises_for_crisp_capture():
+    with pytest.raises(ValueError):
+        text_recognition.preprocess_image(_render_ui_text("Settings", 30), mode="bogus")